@@ -1,22 +1,27 @@
 #!/usr/bin/env python3
 import sys
 import os
-import queue
 import threading
 import logging
-import html
+import logging.handlers
+import queue
+import atexit
 import wave
 import argparse
 import re
 import time
 import textwrap
+import collections
+import warnings
+with warnings.catch_warnings():
+    # deprecated in 3.11 (PEP 594); on 3.13+ the audioop-lts backport provides it
+    warnings.simplefilter("ignore", DeprecationWarning)
+    import audioop
 
 import pyaudio
 import tkinter as tk
 import keyboard
 from PyQt5 import QtWidgets
-from google.cloud import speech, translate_v2 as translate
-from google.api_core import exceptions
 
 # ----------------------------------------
 # CONFIGURATION
@@ -35,7 +40,21 @@ file_handler = logging.FileHandler(log_file, mode='a', encoding='utf-8')
 file_handler.setFormatter(log_formatter)
 stream_handler = logging.StreamHandler()
 stream_handler.setFormatter(log_formatter)
-logging.basicConfig(level=logging.INFO, handlers=[file_handler, stream_handler])
+# callers only enqueue records; file/console I/O happens on the listener thread
+log_queue = queue.SimpleQueue()
+queue_handler = logging.handlers.QueueHandler(log_queue)
+# the listener's handlers apply log_formatter; without this basicConfig would
+# bake its own "LEVEL:name:" prefix into every queued message
+queue_handler.setFormatter(logging.Formatter("%(message)s"))
+logging.basicConfig(level=logging.INFO, handlers=[queue_handler])
+log_listener = logging.handlers.QueueListener(log_queue, file_handler, stream_handler)
+log_listener.start()
+atexit.register(log_listener.stop)
+
+def quit_app():
+    """Flush pending log records, then exit immediately (used by the stop key)."""
+    log_listener.stop()
+    os._exit(0)
 
 def handle_exception(exc_type, exc_value, exc_traceback):
     if issubclass(exc_type, KeyboardInterrupt):
@@ -49,19 +68,67 @@ os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = os.path.join(
 )
 
 RATE = 48000
-CHUNK = RATE // 2
-DISPLAY_INTERVAL = 3500
+STT_RATE = 16000           # audio is resampled to this before streaming
+CHUNK = RATE // 10         # 100 ms of audio per streaming request
+FRAMES_PER_BUFFER = 1024
+SILENCE_RMS = 300          # 16-bit RMS below which a chunk counts as silence
+SILENCE_HANGOVER = 10      # silent chunks (1 s) still sent before the gate closes
+KEEPALIVE_INTERVAL = 5.0   # seconds between chunks sent while gated
+MAX_BUFFERED_SECONDS = 2   # capture backlog kept while the uploader stalls
+STREAM_ROTATE_SECONDS = 240  # restart the stream at the next final after this;
+                             # Google aborts streams at ~305 s (OutOfRange)
+DISPLAY_INTERVAL = 300
+TRANSLATION_CACHE_SIZE = 512
+INTERIM_MIN_GROWTH = 8     # chars an interim must add before it is re-translated
+
+SENTENCE_SPLIT = re.compile(r'(?<=[.?!])\s+')
+SUBTITLE_WRAPPER = textwrap.TextWrapper(width=110)
+
+# transcripts from Transcriber to SubtitleOverlay; deque append/popleft are
+# atomic, and only the newest entry is ever shown, so old ones may fall off
+result_queue = collections.deque(maxlen=64)
 
-result_queue = queue.Queue()
+# ----------------------------------------
+# GOOGLE CLIENTS (shared across sessions)
+# ----------------------------------------
+# keep the HTTP/2 connection warm so stream restarts skip the handshake
+GRPC_CHANNEL_OPTIONS = [
+    ("grpc.keepalive_time_ms", 30000),
+    ("grpc.keepalive_timeout_ms", 10000),
+    ("grpc.http2.max_pings_without_data", 0),
+]
+
+_speech_client = None
+
+def get_speech_client():
+    """Return the process-wide SpeechClient, created on first use."""
+    global _speech_client
+    if _speech_client is None:
+        from google.cloud import speech
+        transport_cls = speech.SpeechClient.get_transport_class("grpc")
+        channel = transport_cls.create_channel(options=GRPC_CHANNEL_OPTIONS)
+        _speech_client = speech.SpeechClient(transport=transport_cls(channel=channel))
+    return _speech_client
+
+_translate_client = None
+
+def get_translate_client():
+    """Return the process-wide Translate v2 client, created on first use."""
+    global _translate_client
+    if _translate_client is None:
+        from google.cloud import translate_v2 as translate
+        _translate_client = translate.Client()
+    return _translate_client
 
 # ----------------------------------------
 # FILE-BASED “MIC” FOR DEV (WAV only)
 # ----------------------------------------
 class FileAudioStream:
-    def __init__(self, filename, rate, chunk):
+    def __init__(self, filename, rate, chunk, realtime=True):
         self.filename = filename
         self.rate = rate
         self.chunk = chunk
+        self.realtime = realtime
         self.wav = None
 
     def __enter__(self):
@@ -76,12 +143,61 @@ class FileAudioStream:
 
     def generator(self):
         seconds_per_chunk = float(self.chunk) / self.rate
+        state = None
+        start = time.monotonic()
+        sent = 0
         while True:
             data = self.wav.readframes(self.chunk)
             if not data:
                 return
+            data, state = audioop.ratecv(data, 2, 1, self.rate, STT_RATE, state)
             yield data
-            time.sleep(seconds_per_chunk)
+            if self.realtime:
+                # pace against the clock so read/send time doesn't add up as drift
+                sent += 1
+                delay = start + sent * seconds_per_chunk - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+
+# ----------------------------------------
+# AUDIO DEVICES
+# ----------------------------------------
+_pyaudio = None
+_input_devices = None
+
+def get_pyaudio():
+    """Return the process-wide PyAudio instance, initialising PortAudio once."""
+    global _pyaudio
+    if _pyaudio is None:
+        _pyaudio = pyaudio.PyAudio()
+    return _pyaudio
+
+def list_input_devices(refresh=False):
+    """Return ({name: index}, default_name) for input devices.
+
+    The probe result is cached; pass refresh=True to re-initialise PortAudio
+    (its device list is fixed at init) and pick up newly plugged devices.
+    Call it from the Qt main thread only: on Windows PortAudio ties COM
+    set-up and teardown to the thread that initialised it.
+    """
+    global _pyaudio, _input_devices
+    if refresh and _pyaudio is not None:
+        _pyaudio.terminate()
+        _pyaudio = None
+        _input_devices = None
+    if _input_devices is None:
+        p = get_pyaudio()
+        try:
+            default_name = p.get_default_input_device_info().get("name")
+        except Exception:
+            default_name = None
+        devices = {}
+        for i in range(p.get_device_count()):
+            info = p.get_device_info_by_index(i)
+            if info.get("maxInputChannels", 0) > 0:
+                devices[info["name"]] = i
+        _input_devices = (devices, default_name)
+    return _input_devices
 
 # ----------------------------------------
 # SETTINGS DIALOG (PyQt5)
@@ -116,24 +232,14 @@ class SettingsDialog(QtWidgets.QDialog):
         layout.addLayout(color_layout)
 
         layout.addWidget(QtWidgets.QLabel("Select Input Device:"))
+        device_layout = QtWidgets.QHBoxLayout()
         self.input_device_combo = QtWidgets.QComboBox()
-        self.devices = {}
-        p = pyaudio.PyAudio()
-        try:
-            default_info = p.get_default_input_device_info()
-            default_name = default_info.get("name")
-        except Exception:
-            default_name = None
-        for i in range(p.get_device_count()):
-            info = p.get_device_info_by_index(i)
-            if info.get("maxInputChannels", 0) > 0:
-                name = info["name"]
-                self.devices[name] = i
-                self.input_device_combo.addItem(name)
-                if name == default_name:
-                    self.input_device_combo.setCurrentText(name)
-        p.terminate()
-        layout.addWidget(self.input_device_combo)
+        device_layout.addWidget(self.input_device_combo, 1)
+        refresh = QtWidgets.QPushButton("Refresh")
+        refresh.clicked.connect(lambda: self.populate_devices(refresh=True))
+        device_layout.addWidget(refresh)
+        layout.addLayout(device_layout)
+        self.populate_devices()
 
         layout.addWidget(QtWidgets.QLabel("Global Stop Key:"))
         self.stop_key = "alt+f11"
@@ -150,6 +256,13 @@ class SettingsDialog(QtWidgets.QDialog):
         btn_layout.addWidget(cancel)
         layout.addLayout(btn_layout)
 
+    def populate_devices(self, refresh=False):
+        self.devices, default_name = list_input_devices(refresh)
+        self.input_device_combo.clear()
+        self.input_device_combo.addItems(list(self.devices))
+        if default_name in self.devices:
+            self.input_device_combo.setCurrentText(default_name)
+
     def choose_color(self):
         color = QtWidgets.QColorDialog.getColor(parent=self)
         if color.isValid():
@@ -172,7 +285,7 @@ class SettingsDialog(QtWidgets.QDialog):
 # OVERLAY WINDOW (Tkinter) WITH ROLLING 3-LINE BUFFER
 # ----------------------------------------
 class SubtitleOverlay(tk.Tk):
-    def __init__(self, subtitle_color, poll_interval, target_lang):
+    def __init__(self, subtitle_color, poll_interval, source_lang, target_lang):
         super().__init__()
         self.overrideredirect(True)
         self.attributes("-topmost", True)
@@ -195,72 +308,162 @@ class SubtitleOverlay(tk.Tk):
         self.label.place(relx=0, rely=0.5, anchor="w", width=w-100, height=200)
 
         self.poll_interval = poll_interval
-        self.translate_client = translate.Client()
+        self.translate_client = get_translate_client()
+        # known from the settings, so the API needn't detect it per request
+        self.source_lang = source_lang.split("-")[0]
         self.target_lang = target_lang
+        # sentence -> translation, kept in LRU order
+        self._tx_cache = collections.OrderedDict()
 
         self.lines = []
-
-        self.after(self.poll_interval, self._poll_queue)
-
-    def _poll_queue(self):
-        latest = None
-        while True:
-            try:
-                raw = result_queue.get_nowait()
-            except queue.Empty:
-                break
-            if raw is None:
+        self._wrapped_text = None
+        self._last_display = None
+        self._last_src = ""
+        self._last_translated = ""
+
+        # translation runs on a worker thread so network round-trips never
+        # block Tk; finished subtitle texts come back through _display_queue
+        self._transcript_ready = threading.Event()
+        self._closed = threading.Event()
+        self._display_queue = collections.deque()
+        self.bind("<<SubtitleReady>>", self._poll_queue)
+        threading.Thread(target=self._translate_worker, daemon=True).start()
+
+    def notify(self):
+        """Wake the translation worker after a transcript was queued (any thread)."""
+        self._transcript_ready.set()
+
+    def destroy(self):
+        # stop the worker so it can't drain result_queue for the next session
+        self._closed.set()
+        self._transcript_ready.set()
+        super().destroy()
+
+    def _translate_worker(self):
+        while not self._closed.is_set():
+            # woken by notify(); the timeout is only a safety net for a missed wake
+            self._transcript_ready.wait(self.poll_interval / 1000)
+            self._transcript_ready.clear()
+            if self._closed.is_set():
+                return
+            latest = None
+            final_seen = False
+            while result_queue:
+                latest, is_final = result_queue.popleft()
+                final_seen = final_seen or is_final
+            if not latest:
                 continue
-            latest = raw
 
-        if latest:
-            parts = re.split(r'(?<=[.?!])\s+', latest)
-            for sentence in parts:
-                if not sentence:
-                    continue
+            # interims mostly extend the previous one by a word or two; keep
+            # showing the last translation until enough new text has arrived.
+            # Never reuse across a final (even one superseded in this drain),
+            # so a reused translation is always corrected when the utterance ends
+            if (not final_seen and self._last_src and latest.startswith(self._last_src)
+                    and len(latest) - len(self._last_src) < INTERIM_MIN_GROWTH):
+                translated = self._last_translated
+            else:
+                parts = [p for p in SENTENCE_SPLIT.split(latest) if p]
+                translated = " ".join(self._translate(parts, is_final))
+                self._last_src = latest
+                self._last_translated = translated
+
+            # wrap into lines, unless this is the same text we wrapped last time
+            if translated != self._wrapped_text:
+                # only the last 2 lines are shown, so long text is cut to its
+                # last ~3 lines (at a word boundary) before wrapping
+                tail = translated
+                limit = SUBTITLE_WRAPPER.width * 3
+                if len(tail) > limit:
+                    tail = tail[-limit:].split(" ", 1)[-1]
+                self.lines = SUBTITLE_WRAPPER.wrap(tail)[-2:]
+                self._wrapped_text = translated
+
+            display_text = "\n".join(self.lines)
+            # a new transcript often renders identically (punctuation-only
+            # changes, cached sentences); don't relayout the label for it
+            if display_text != self._last_display:
+                self._last_display = display_text
+                self._display_queue.append(display_text)
                 try:
-                    res = self.translate_client.translate(sentence,
-                                                          target_language=self.target_lang)
-                    translated = html.unescape(res.get("translatedText", sentence))
-                except Exception as e:
-                    logging.error("Translation error: %s", e)
-                    translated = sentence
-
-                # wrap into lines
-                new_lines = textwrap.wrap(translated, width=110)
-                # display only this translation, scrolling if more than 3 lines
-                if len(new_lines) > 2:
-                    self.lines = new_lines[-2:]
-                else:
-                    self.lines = new_lines
-
-                display_text = "\n".join(self.lines)
-                self.label.config(text=display_text)
-                logging.info(f"Displayed subtitle buffer:\n{display_text}")
-                break
-
-        self.after(self.poll_interval, self._poll_queue)
+                    self.event_generate("<<SubtitleReady>>", when="tail")
+                except (RuntimeError, tk.TclError):
+                    # Tk isn't running (yet or anymore); the next event drains the queue
+                    pass
+                logging.debug("Displayed subtitle buffer:\n%s", display_text)
+
+            # throttle: whatever arrives meanwhile is picked up after the interval
+            time.sleep(self.poll_interval / 1000)
+
+    def _poll_queue(self, event=None):
+        display_text = None
+        while self._display_queue:
+            display_text = self._display_queue.popleft()
+        if display_text is not None:
+            self.label.config(text=display_text)
+
+    def _translate(self, sentences, is_final=True):
+        """Translate sentences, sending all cache misses in a single API call.
+
+        In an interim transcript the last sentence is still being spoken and
+        will change, so its translation is returned but not cached.
+        """
+        # sentences without letters (numbers, stray punctuation) translate to themselves
+        misses = [s for s in dict.fromkeys(sentences)
+                  if s not in self._tx_cache and any(c.isalpha() for c in s)]
+        if misses:
+            try:
+                # format_="text" returns plain text, so no HTML entities to unescape
+                results = self.translate_client.translate(misses,
+                                                          target_language=self.target_lang,
+                                                          source_language=self.source_lang,
+                                                          format_="text")
+            except Exception as e:
+                logging.error("Translation error: %s", e)
+                results = []
+            fresh = {s: res.get("translatedText", s) for s, res in zip(misses, results)}
+            for sentence, text in fresh.items():
+                if is_final or sentence != sentences[-1]:
+                    self._tx_cache[sentence] = text
+            while len(self._tx_cache) > TRANSLATION_CACHE_SIZE:
+                self._tx_cache.popitem(last=False)
+        else:
+            fresh = {}
+
+        translated = []
+        for sentence in sentences:
+            if sentence in self._tx_cache:
+                self._tx_cache.move_to_end(sentence)
+                translated.append(self._tx_cache[sentence])
+            else:
+                translated.append(fresh.get(sentence, sentence))
+        return translated
 
 # ----------------------------------------
 # LIVE MIC STREAM
 # ----------------------------------------
 class MicrophoneStream:
-    def __init__(self, rate, chunk, device_index=None):
+    def __init__(self, rate, chunk, device_index=None, silence_rms=SILENCE_RMS):
         self.rate = rate
         self.chunk = chunk
         self.device = device_index
-        self._buff = queue.Queue()
+        self.silence_rms = silence_rms  # 0 disables the silence gate
+        # PortAudio callback only appends here (atomic, no lock); the
+        # generator is woken through the event and drains everything at once
+        self._buff = collections.deque(
+            maxlen=int(MAX_BUFFERED_SECONDS * rate / FRAMES_PER_BUFFER))
+        self._dropped = 0
+        self._data_ready = threading.Event()
         self.closed = True
 
     def __enter__(self):
-        self.audio_interface = pyaudio.PyAudio()
+        self.audio_interface = get_pyaudio()
         self.audio_stream = self.audio_interface.open(
             format=pyaudio.paInt16,
             channels=1,
             rate=self.rate,
             input=True,
             input_device_index=self.device,
-            frames_per_buffer=self.chunk,
+            frames_per_buffer=FRAMES_PER_BUFFER,
             stream_callback=self._fill_buffer
         )
         self.closed = False
@@ -268,79 +471,152 @@ class MicrophoneStream:
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.closed = True
+        self._data_ready.set()
         self.audio_stream.stop_stream()
         self.audio_stream.close()
-        self.audio_interface.terminate()
 
     def _fill_buffer(self, in_data, frame_count, time_info, status):
-        self._buff.put(in_data)
+        # a full deque drops its oldest buffer on append: prefer fresh speech
+        # over stale audio when the upload stalls
+        if len(self._buff) == self._buff.maxlen:
+            self._dropped += 1
+        self._buff.append(in_data)
+        # Event.set() takes a lock; skip it while the consumer hasn't caught up
+        if not self._data_ready.is_set():
+            self._data_ready.set()
         return None, pyaudio.paContinue
 
     def generator(self):
+        # PortAudio delivers small buffers; send them on once a full chunk is in
+        min_bytes = self.chunk * 2
+        data = bytearray()
+        state = None
+        silent_chunks = 0
+        last_sent = 0.0
+        preroll = None
         while not self.closed:
-            chunk = self._buff.get()
-            if chunk is None:
-                return
-            data = [chunk]
-            while True:
-                try:
-                    c = self._buff.get(block=False)
-                except queue.Empty:
-                    break
-                data.append(c)
-            yield b"".join(data)
+            self._data_ready.wait()
+            self._data_ready.clear()
+            while self._buff:
+                data += self._buff.popleft()
+            if self._dropped:
+                logging.warning("Audio backlog full; dropped %d buffers", self._dropped)
+                self._dropped = 0
+            if len(data) < min_bytes:
+                continue
+
+            # capture at the device rate, stream at STT_RATE (a third of the bytes)
+            pcm, state = audioop.ratecv(data, 2, 1, self.rate, STT_RATE, state)
+            data.clear()
+
+            # don't stream long silences, but send one chunk now and then
+            # so Google doesn't drop the stream for lack of audio
+            if self.silence_rms and audioop.rms(pcm, 2) < self.silence_rms:
+                silent_chunks += 1
+            else:
+                silent_chunks = 0
+            now = time.monotonic()
+            if silent_chunks <= SILENCE_HANGOVER or now - last_sent >= KEEPALIVE_INTERVAL:
+                # soft onsets fall just under the threshold; when the gate
+                # reopens, send the chunk before it too (one-chunk pre-roll)
+                if preroll is not None and not silent_chunks:
+                    yield preroll
+                preroll = None
+                yield pcm
+                last_sent = now
+            else:
+                preroll = pcm
 
 # ----------------------------------------
 # TRANSCRIBER THREAD
 # ----------------------------------------
 class Transcriber(threading.Thread):
-    def __init__(self, src, tgt, stream_cls, stream_arg):
+    def __init__(self, src, tgt, stream_cls, stream_arg, notify=None, realtime=True,
+                 silence_rms=SILENCE_RMS):
         super().__init__(daemon=True)
         self.src = src
         self.tgt = tgt
         self.stream_cls = stream_cls
         self.stream_arg = stream_arg
+        self.notify = notify
+        self.realtime = realtime
+        self.silence_rms = silence_rms
+        self._last_pushed = None
         self.stop_event = threading.Event()
-        self.speech = speech.SpeechClient()
+        from google.cloud import speech
+        self.speech = get_speech_client()
 
-    def run(self):
+        # static for the thread's lifetime; reused by every reconnect
         cfg = speech.RecognitionConfig(
             encoding=speech.RecognitionConfig.AudioEncoding.LINEAR16,
-            sample_rate_hertz=RATE,
+            sample_rate_hertz=STT_RATE,
             language_code=self.src,
             enable_automatic_punctuation=True,
             enable_word_confidence=True,
             model="phone_call",
             use_enhanced=True
         )
-        stream_cfg = speech.StreamingRecognitionConfig(
+        self._stream_cfg = speech.StreamingRecognitionConfig(
             config=cfg,
-            interim_results=True
+            interim_results=True,
+            single_utterance=False
         )
 
+    def run(self):
+        from google.cloud import speech
+        from google.api_core import exceptions
+
+        dev_file = isinstance(self.stream_arg, str)
         while not self.stop_event.is_set():
+            rotate = False
             try:
                 logging.info("Starting new speech stream")
-                mic_ctx = (FileAudioStream(self.stream_arg, RATE, CHUNK)
-                           if isinstance(self.stream_arg, str)
-                           else MicrophoneStream(RATE, CHUNK, self.stream_arg))
+                mic_ctx = (FileAudioStream(self.stream_arg, RATE, CHUNK, self.realtime)
+                           if dev_file
+                           else MicrophoneStream(RATE, CHUNK, self.stream_arg,
+                                                 self.silence_rms))
 
                 with mic_ctx as mic:
+                    request_cls = speech.StreamingRecognizeRequest
                     requests = (
-                        speech.StreamingRecognizeRequest(audio_content=chunk)
+                        request_cls(audio_content=chunk)
                         for chunk in mic.generator()
                     )
-                    for resp in self.speech.streaming_recognize(stream_cfg, requests):
-                        if self.stop_event.is_set():
+                    stopped = self.stop_event.is_set
+                    stream_start = time.monotonic()
+                    for resp in self.speech.streaming_recognize(self._stream_cfg, requests):
+                        if stopped():
                             break
-                        if not resp.results or not resp.results[0].alternatives:
+                        # every proto field access goes through proto-plus; read each once
+                        results = resp.results
+                        if not results:
+                            continue
+                        result = results[0]
+                        alternatives = result.alternatives
+                        if not alternatives:
                             continue
 
-                        text = resp.results[0].alternatives[0].transcript.strip()
-                        if text:
-                            result_queue.put(text)
-                            prefix = "Final" if resp.results[0].is_final else "Interim"
-                            logging.info(f"{prefix}: {text}")
+                        text = alternatives[0].transcript.strip()
+                        is_final = result.is_final
+                        # a final often repeats the last interim's text; it still
+                        # has to go through so the overlay caches and logs it
+                        if text and (text, is_final) != self._last_pushed:
+                            self._last_pushed = (text, is_final)
+                            result_queue.append((text, is_final))
+                            if self.notify:
+                                self.notify()
+                            if is_final:
+                                logging.info("Final: %s", text)
+                            else:
+                                logging.debug("Interim: %s", text)
+
+                        # rotate on our terms, right after an utterance ends, rather
+                        # than being cut off mid-sentence by OutOfRange (a dev file
+                        # would restart from the top, so it is left to run out)
+                        if (is_final and not dev_file
+                                and time.monotonic() - stream_start > STREAM_ROTATE_SECONDS):
+                            rotate = True
+                            break
 
             except exceptions.OutOfRange:
                 logging.warning("Stream duration exceeded; restarting stream")
@@ -354,8 +630,13 @@ class Transcriber(threading.Thread):
                 time.sleep(0.5)
                 continue
 
+            if rotate:
+                logging.info("Stream reached %d s; rotating after final result",
+                             STREAM_ROTATE_SECONDS)
+                continue
+
             # If you're in dev-file mode and only want to run the file once, you can exit here:
-            if isinstance(self.stream_arg, str):
+            if dev_file:
                 logging.info("Dev-file mode complete; exiting Transcriber thread.")
                 break
 
@@ -370,10 +651,16 @@ def main():
     parser = argparse.ArgumentParser()
     parser.add_argument("--dev-file",
                         help="Path to a mono 16-bit 48 kHz WAV for dev mode")
+    parser.add_argument("--no-realtime", action="store_true",
+                        help="Stream --dev-file as fast as possible instead of in real time")
     parser.add_argument(
         "--display-interval", type=int, default=DISPLAY_INTERVAL,
         help="Time (ms) between subtitle updates"
     )
+    parser.add_argument(
+        "--silence-rms", type=int, default=SILENCE_RMS,
+        help="Mic level (16-bit RMS) below which audio isn't streamed; 0 disables"
+    )
     args = parser.parse_args()
 
     stream_cls = FileAudioStream if args.dev_file else MicrophoneStream
@@ -386,21 +673,27 @@ def main():
         cfg = dlg.get_settings()
 
         keyboard.unhook_all()
-        keyboard.add_hotkey(cfg["stop_key"], lambda: os._exit(0))
+        keyboard.add_hotkey(cfg["stop_key"], quit_app)
 
         stream_arg = args.dev_file or cfg["input_device_index"]
 
+        overlay = SubtitleOverlay(
+            cfg["subtitle_color"],
+            poll_interval=args.display_interval,
+            source_lang=cfg["source_lang"],
+            target_lang=cfg["target_lang"]
+        )
+
         trans = Transcriber(cfg["source_lang"],
                             cfg["target_lang"],
                             stream_cls,
-                            stream_arg)
+                            stream_arg,
+                            notify=overlay.notify,
+                            realtime=not args.no_realtime,
+                            silence_rms=args.silence_rms)
         trans.start()
 
-        SubtitleOverlay(
-            cfg["subtitle_color"],
-            poll_interval=args.display_interval,
-            target_lang=cfg["target_lang"]
-        ).mainloop()
+        overlay.mainloop()
 
         trans.stop()
         trans.join()